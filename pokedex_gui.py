@@ -1,91 +1,103 @@
 import customtkinter as ctk
 import requests
-from PIL import Image, ImageTk
-import io
+from requests.adapters import HTTPAdapter
+from PIL import Image
+import os
 import threading
-import re
+from pathlib import Path
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from validators import InputValidator
+
+try:
+    import orjson  # Optional: much faster JSON decoding
+except ImportError:
+    orjson = None
+
+try:
+    from platformdirs import user_cache_dir  # Optional: per-platform cache location
+except ImportError:
+    user_cache_dir = None
 
 # --- API Configuration ---
 BASE_URL = "https://pokeapi.co/api/v2/pokemon/"
+REQUEST_TIMEOUT = 10
 
-# --- Input Validation ---
-class InputValidator:
-    """
-    Validates and sanitizes user input to prevent injection attacks.
-    This includes SQL injection, command injection, and path traversal.
+# Shared session so repeated searches reuse pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": "PokeAPI-Data-Fetcher"})
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Display size of the Pokémon artwork
+IMAGE_SIZE = (300, 300)
+
+# Delay before an Enter key press triggers a search, so held/repeated presses coalesce
+SEARCH_DEBOUNCE_MS = 150
+
+# Maximum number of Pokémon (and images) kept in memory
+CACHE_SIZE = 64
+
+# Downscaled artwork is kept here across runs, one <id>.png per Pokémon
+if user_cache_dir is not None:
+    IMAGE_CACHE_DIR = Path(user_cache_dir("pokedex"))
+else:
+    IMAGE_CACHE_DIR = Path.home() / ".cache" / "pokedex"
+
+def parse_json(response):
+    """Decodes a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+def slim_pokemon_data(data):
     """
+    Keeps only the fields the UI displays from a full /pokemon response.
     
-    # Maximum allowed input length
-    MAX_INPUT_LENGTH = 50
-    
-    # Regex pattern for valid Pokemon names (alphanumeric, hyphens, spaces only)
-    VALID_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9\-\s]+$')
+    The full payload carries every move, game index and sprite variant; the
+    slim copy keeps the same nesting so it can be used in its place.
+    """
+    sprites = data['sprites']
+    return {
+        'name': data['name'],
+        'id': data['id'],
+        'stats': [{'stat': {'name': s['stat']['name']}, 'base_stat': s['base_stat']} for s in data['stats']],
+        'types': [{'type': {'name': t['type']['name']}} for t in data['types']],
+        'abilities': [{'ability': {'name': a['ability']['name']}} for a in data['abilities']],
+        'sprites': {
+            'front_default': sprites['front_default'],
+            'other': {'official-artwork': {'front_default': sprites['other']['official-artwork']['front_default']}},
+        },
+    }
+
+# --- Response Cache ---
+class LRUCache:
+    """
+    Small thread-safe least-recently-used cache.
+    Used to keep API responses and images so repeated searches skip the network.
+    """
     
-    # Dangerous patterns to block (SQL injection, command injection, etc.)
-    DANGEROUS_PATTERNS = [
-        r'[;\'\"\`]',           # SQL/command terminators and quotes
-        r'--',                   # SQL comment
-        r'/\*',                  # SQL block comment start
-        r'\*/',                  # SQL block comment end
-        r'\b(SELECT|INSERT|UPDATE|DELETE|DROP|TRUNCATE|ALTER|CREATE|EXEC|UNION|OR|AND)\b',  # SQL keywords
-        r'[<>]',                 # XSS brackets
-        r'\.\.',                 # Path traversal
-        r'[/\\]',                # Path separators
-        r'[\x00-\x1f]',          # Control characters
-    ]
+    def __init__(self, max_size: int = CACHE_SIZE):
+        self.max_size = max_size
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
     
-    @classmethod
-    def validate_pokemon_name(cls, name: str) -> tuple[bool, str, str]:
-        """
-        Validates and sanitizes a Pokemon name input.
-        
-        Args:
-            name: The raw user input
-            
-        Returns:
-            Tuple of (is_valid, sanitized_name, error_message)
-        """
-        # Check if input is empty
-        if not name or not name.strip():
-            return False, "", "Please enter a Pokémon name"
-        
-        # Strip whitespace and convert to lowercase
-        sanitized = name.strip().lower()
-        
-        # Check length
-        if len(sanitized) > cls.MAX_INPUT_LENGTH:
-            return False, "", f"Input too long (max {cls.MAX_INPUT_LENGTH} characters)"
-        
-        # Check for dangerous patterns
-        for pattern in cls.DANGEROUS_PATTERNS:
-            if re.search(pattern, name, re.IGNORECASE):
-                return False, "", "Invalid characters detected in input"
-        
-        # Check if name matches valid pattern
-        if not cls.VALID_NAME_PATTERN.match(sanitized):
-            return False, "", "Pokémon name can only contain letters, numbers, and hyphens"
-        
-        return True, sanitized, ""
+    def get(self, key):
+        """Returns the cached value for key, or None if it is not cached."""
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
     
-    @classmethod
-    def is_safe_input(cls, user_input: str) -> bool:
-        """
-        Quick check if input is safe (no dangerous patterns).
-        
-        Args:
-            user_input: The raw user input
-            
-        Returns:
-            True if input appears safe, False otherwise
-        """
-        if not user_input:
-            return False
-            
-        for pattern in cls.DANGEROUS_PATTERNS:
-            if re.search(pattern, user_input, re.IGNORECASE):
-                return False
-        
-        return True
+    def put(self, key, value):
+        """Stores value under key, evicting the oldest entry when full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.max_size:
+                self._data.popitem(last=False)
 
 class PokedexApp(ctk.CTk):
     def __init__(self):
@@ -103,6 +115,23 @@ class PokedexApp(ctk.CTk):
 
         # Variables
         self.current_pokemon_data = None
+        self._pokemon_cache = LRUCache()
+        self._image_cache = LRUCache()
+        
+        # Search bookkeeping: only the newest search may update the UI
+        self._req_seq = 0
+        self._img_future = None
+        self._search_after_id = None
+        
+        # Worker pool for network and image work, reused across searches
+        self._pool = ThreadPoolExecutor(max_workers=4)
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # Fonts (created once and shared between widgets)
+        self._font_title = ctk.CTkFont(size=24, weight="bold", family="Inter")
+        self._font_name = ctk.CTkFont(size=32, weight="bold")
+        self._font_id = ctk.CTkFont(size=18)
+        self._font_stat = ctk.CTkFont(size=11, weight="bold")
 
         # --- Layout ---
         
@@ -111,12 +140,12 @@ class PokedexApp(ctk.CTk):
         self.sidebar_frame.grid(row=0, column=0, sticky="nsew")
         self.sidebar_frame.grid_rowconfigure(4, weight=1)
 
-        self.logo_label = ctk.CTkLabel(self.sidebar_frame, text="Pokédex", font=ctk.CTkFont(size=24, weight="bold", family="Inter"))
+        self.logo_label = ctk.CTkLabel(self.sidebar_frame, text="Pokédex", font=self._font_title)
         self.logo_label.grid(row=0, column=0, padx=20, pady=(20, 10))
 
         self.search_entry = ctk.CTkEntry(self.sidebar_frame, placeholder_text="Enter Pokémon Name...")
         self.search_entry.grid(row=1, column=0, padx=20, pady=10)
-        self.search_entry.bind("<Return>", lambda e: self.search_pokemon())
+        self.search_entry.bind("<Return>", self.on_return_key)
 
         self.search_button = ctk.CTkButton(self.sidebar_frame, text="Search", command=self.search_pokemon, fg_color="#DD2D44", hover_color="#B91C1C")
         self.search_button.grid(row=2, column=0, padx=20, pady=10)
@@ -141,30 +170,29 @@ class PokedexApp(ctk.CTk):
         self.info_container = ctk.CTkFrame(self.main_content, fg_color="transparent")
         self.info_container.grid(row=0, column=1, padx=20, pady=20, sticky="nsew")
 
-        self.name_label = ctk.CTkLabel(self.info_container, text="---", font=ctk.CTkFont(size=32, weight="bold"))
+        self.name_label = ctk.CTkLabel(self.info_container, text="---", font=self._font_name)
         self.name_label.pack(anchor="w", pady=(0, 5))
 
-        self.id_label = ctk.CTkLabel(self.info_container, text="#000", font=ctk.CTkFont(size=18), text_color="gray")
+        self.id_label = ctk.CTkLabel(self.info_container, text="#000", font=self._font_id, text_color="gray")
         self.id_label.pack(anchor="w", pady=(0, 20))
 
         # Stats Section
         self.stats_frame = ctk.CTkFrame(self.info_container, fg_color="transparent")
         self.stats_frame.pack(fill="x", expand=True)
+        # One grid for all stats: label | bar (stretches) | value
+        self.stats_frame.grid_columnconfigure(1, weight=1)
         
         self.stat_widgets = {}
-        for stat_name in ["hp", "attack", "defense", "speed"]:
-            row = ctk.CTkFrame(self.stats_frame, fg_color="transparent")
-            row.pack(fill="x", pady=2)
-            
-            lbl = ctk.CTkLabel(row, text=stat_name.upper(), width=80, anchor="w", font=ctk.CTkFont(size=11, weight="bold"))
-            lbl.pack(side="left")
+        for i, stat_name in enumerate(["hp", "attack", "defense", "speed"]):
+            lbl = ctk.CTkLabel(self.stats_frame, text=stat_name.upper(), width=80, anchor="w", font=self._font_stat)
+            lbl.grid(row=i, column=0, pady=2, sticky="w")
             
-            progress = ctk.CTkProgressBar(row, height=10, progress_color="#DD2D44")
+            progress = ctk.CTkProgressBar(self.stats_frame, height=10, progress_color="#DD2D44")
             progress.set(0)
-            progress.pack(side="left", fill="x", expand=True, padx=10)
+            progress.grid(row=i, column=1, padx=10, pady=2, sticky="ew")
             
-            val_lbl = ctk.CTkLabel(row, text="0", width=30)
-            val_lbl.pack(side="right")
+            val_lbl = ctk.CTkLabel(self.stats_frame, text="0", width=30)
+            val_lbl.grid(row=i, column=2, pady=2, sticky="e")
             
             self.stat_widgets[stat_name] = (progress, val_lbl)
 
@@ -178,7 +206,20 @@ class PokedexApp(ctk.CTk):
         self.ability_label = ctk.CTkLabel(self.details_frame, text="Abilities: ---", anchor="w", wraplength=300)
         self.ability_label.pack(fill="x")
 
+        # Warm up DNS and the TLS connection so the first search skips the handshake
+        self._pool.submit(SESSION.head, BASE_URL, timeout=5)
+
+    def on_return_key(self, event=None):
+        # Debounce Enter so holding the key doesn't queue a search per repeat
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(SEARCH_DEBOUNCE_MS, self.search_pokemon)
+
     def search_pokemon(self):
+        # A direct click replaces any debounced Enter search still pending
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
         raw_name = self.search_entry.get()
         
         # Validate input to prevent injection attacks and malformed requests
@@ -191,32 +232,59 @@ class PokedexApp(ctk.CTk):
         self.status_label.configure(text="Searching...", text_color="gray")
         self.search_button.configure(state="disabled")
         
-        # Run in thread to keep GUI responsive
-        thread = threading.Thread(target=self.fetch_pokemon_data, args=(sanitized_name,))
-        thread.start()
+        # Supersede any in-flight search and drop its pending image download
+        self._req_seq += 1
+        if self._img_future is not None:
+            self._img_future.cancel()
+            self._img_future = None
+        
+        # Run in worker thread to keep GUI responsive
+        self._pool.submit(self.fetch_pokemon_data, sanitized_name, self._req_seq)
 
-    def fetch_pokemon_data(self, name):
+    def fetch_pokemon_data(self, name, req_id):
         try:
-            response = requests.get(f"{BASE_URL}{name}")
-            if response.status_code == 200:
-                data = response.json()
-                self.after(0, lambda: self.update_ui(data))
-            else:
-                self.after(0, lambda: self.show_error(f"Pokemon '{name}' not found"))
+            data = self._pokemon_cache.get(name)
+            if data is None:
+                response = SESSION.get(f"{BASE_URL}{name}", timeout=REQUEST_TIMEOUT)
+                if response.status_code != 200:
+                    self.after(0, self.deliver, req_id, self.show_error, f"Pokemon '{name}' not found")
+                    return
+                data = slim_pokemon_data(parse_json(response))
+                self._pokemon_cache.put(name, data)
+            
+            # Nothing left to do if a newer search has started meanwhile
+            if req_id != self._req_seq:
+                return
+            
+            # Start the image download now so it overlaps with the UI update
+            image_url = self.get_image_url(data)
+            img_future = self._pool.submit(self.load_pokemon_image, image_url, data['id']) if image_url else None
+            self.after(0, self.deliver, req_id, self.update_ui, data, img_future)
         except Exception as e:
-            self.after(0, lambda: self.show_error("Network Error"))
+            self.after(0, self.deliver, req_id, self.show_error, "Network Error")
         finally:
-            self.after(0, lambda: self.search_button.configure(state="normal"))
+            self.after(0, self.deliver, req_id, partial(self.search_button.configure, state="normal"))
+
+    def deliver(self, req_id, callback, *args):
+        # Drop results from searches that have since been superseded
+        if req_id == self._req_seq:
+            callback(*args)
+
+    def update_ui(self, data, img_future=None):
+        # Work out every value first, so a malformed payload fails before any widget changes
+        name_text = data['name'].capitalize()
+        id_text = f"No. {data['id']:03d}"
+        stats = {s['stat']['name']: s['base_stat'] for s in data['stats']}
+        types = [t['type']['name'].capitalize() for t in data['types']]
+        abilities = [a['ability']['name'].replace('-', ' ').title() for a in data['abilities']]
 
-    def update_ui(self, data):
         self.status_label.configure(text="Pokémon Loaded!", text_color="#10B981")
         
         # Name and ID
-        self.name_label.configure(text=data['name'].capitalize())
-        self.id_label.configure(text=f"No. {data['id']:03d}")
+        self.name_label.configure(text=name_text)
+        self.id_label.configure(text=id_text)
 
         # Basic Stats
-        stats = {s['stat']['name']: s['base_stat'] for s in data['stats']}
         for name, (progress, lbl) in self.stat_widgets.items():
             if name in stats:
                 val = stats[name]
@@ -224,34 +292,94 @@ class PokedexApp(ctk.CTk):
                 lbl.configure(text=str(val))
 
         # Types
-        types = [t['type']['name'].capitalize() for t in data['types']]
         self.type_label.configure(text=f"Type: {' / '.join(types)}")
 
         # Abilities
-        abilities = [a['ability']['name'].replace('-', ' ').title() for a in data['abilities']]
         self.ability_label.configure(text=f"Abilities: {', '.join(abilities)}")
 
-        # Load Image
+        # Show Image once its download finishes
+        if img_future is not None:
+            self._img_future = img_future
+            req_id = self._req_seq
+            img_future.add_done_callback(partial(self.on_image_loaded, req_id))
+
+    @staticmethod
+    def get_image_url(data):
         image_url = data['sprites']['other']['official-artwork']['front_default']
         if not image_url:
             image_url = data['sprites']['front_default']
-            
-        if image_url:
-            thread = threading.Thread(target=self.load_pokemon_image, args=(image_url,))
-            thread.start()
+        return image_url
 
-    def load_pokemon_image(self, url):
-        try:
-            response = requests.get(url)
-            img_data = response.content
-            img = Image.open(io.BytesIO(img_data))
+    def load_pokemon_image(self, url, pokemon_id):
+        ctk_img = self._image_cache.get(url)
+        if ctk_img is None:
+            cache_path = IMAGE_CACHE_DIR / f"{pokemon_id}.png"
+            img = self.read_cached_image(cache_path)
+            downloaded = img is None
+            if downloaded:
+                # Hand the stream to Pillow so requests doesn't also build response.content;
+                # Pillow still reads the whole body into its own buffer before decoding
+                with SESSION.get(url, stream=True, timeout=REQUEST_TIMEOUT) as response:
+                    response.raise_for_status()
+                    response.raw.decode_content = True
+                    img = Image.open(response.raw)
+                    img.draft("RGB", IMAGE_SIZE)
+                    img.load()
+                
+                # Resize image once here rather than leaving it to CTkImage
+                img.thumbnail(IMAGE_SIZE, Image.Resampling.LANCZOS)
             
-            # Resize image
-            ctk_img = ctk.CTkImage(light_image=img, dark_image=img, size=(300, 300))
+            ctk_img = ctk.CTkImage(light_image=img, dark_image=img, size=IMAGE_SIZE)
+            self._image_cache.put(url, ctk_img)
             
-            self.after(0, lambda: self.pokemon_img_label.configure(image=ctk_img, text=""))
+            # Save to disk as separate work so it doesn't delay showing the image;
+            # the copy keeps the save independent of CTkImage's own resizing
+            if downloaded:
+                try:
+                    self._pool.submit(self.write_cached_image, img.copy(), cache_path)
+                except RuntimeError:
+                    pass  # Pool already shut down because the window is closing
+        return ctk_img
+
+    @staticmethod
+    def read_cached_image(cache_path):
+        """Returns the image stored at cache_path, or None if missing or unreadable."""
+        if not cache_path.exists():
+            return None
+        try:
+            img = Image.open(cache_path)
+            img.load()
+            return img
+        except OSError:
+            return None
+
+    @staticmethod
+    def write_cached_image(img, cache_path):
+        """Saves img to the disk cache; failures only cost a re-download next time."""
+        # Write to a temporary file first so readers never see a partial PNG
+        tmp_path = cache_path.with_name(f"{cache_path.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            img.save(tmp_path, format="PNG")
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+        finally:
+            # Only still there if the save or rename failed partway
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    def on_image_loaded(self, req_id, future):
+        if future.cancelled():
+            return
+        try:
+            ctk_img = future.result()
         except Exception:
-            self.after(0, lambda: self.pokemon_img_label.configure(text="Image Loading Failed"))
+            self.after(0, self.deliver, req_id, partial(self.pokemon_img_label.configure, text="Image Loading Failed"))
+            return
+        self.after(0, self.deliver, req_id, partial(self.pokemon_img_label.configure, image=ctk_img, text=""))
 
     def show_error(self, message):
         self.status_label.configure(text=message, text_color="#EF4444")
@@ -262,6 +390,11 @@ class PokedexApp(ctk.CTk):
             progress.set(0)
             lbl.configure(text="0")
 
+    def on_close(self):
+        # Drop queued work so pending downloads don't keep the process alive
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
+
 if __name__ == "__main__":
     app = PokedexApp()
     app.mainloop()
@@ -0,0 +1,96 @@
+import re
+
+# --- Input Validation ---
+class InputValidator:
+    """
+    Validates and sanitizes user input to prevent injection attacks.
+    This includes SQL injection, command injection, and path traversal.
+    """
+    
+    # Maximum allowed input length
+    MAX_INPUT_LENGTH = 50
+    
+    # Characters allowed in a sanitized (lowercased) Pokemon name
+    _ALLOWED = frozenset("abcdefghijklmnopqrstuvwxyz0123456789- ")
+    
+    # Dangerous patterns to block (SQL injection, command injection, etc.)
+    DANGEROUS_PATTERNS = [
+        r'[;\'\"\`]',           # SQL/command terminators and quotes
+        r'--',                   # SQL comment
+        r'/\*',                  # SQL block comment start
+        r'\*/',                  # SQL block comment end
+        r'\b(select|insert|update|delete|drop|truncate|alter|create|exec|union|or|and)\b',  # SQL keywords
+        r'[<>]',                 # XSS brackets
+        r'\.\.',                 # Path traversal
+        r'[/\\]',                # Path separators
+        r'[\x00-\x1f]',          # Control characters
+    ]
+    
+    # All dangerous patterns merged into one alternation, compiled once.
+    # Patterns are lowercase and matched against lowercased input.
+    _DANGEROUS_RE = re.compile("|".join(f"(?:{p})" for p in DANGEROUS_PATTERNS))
+    
+    # SQL keywords, checked as whole words once the allowlist has passed
+    _SQL_KEYWORDS = frozenset({
+        "select", "insert", "update", "delete", "drop", "truncate",
+        "alter", "create", "exec", "union", "or", "and",
+    })
+    
+    @classmethod
+    def validate_pokemon_name(cls, name: str) -> tuple[bool, str, str]:
+        """
+        Validates and sanitizes a Pokemon name input.
+        
+        Args:
+            name: The raw user input
+            
+        Returns:
+            Tuple of (is_valid, sanitized_name, error_message)
+        """
+        # Check if input is empty
+        if not name or not name.strip():
+            return False, "", "Please enter a Pokémon name"
+        
+        # Strip whitespace and convert to lowercase
+        sanitized = name.strip().lower()
+        
+        # Check length
+        if len(sanitized) > cls.MAX_INPUT_LENGTH:
+            return False, "", f"Input too long (max {cls.MAX_INPUT_LENGTH} characters)"
+        
+        # Fast path: plain ASCII letters/digits (most names) can only fail on a SQL keyword
+        if sanitized.isascii() and sanitized.isalnum():
+            if sanitized in cls._SQL_KEYWORDS:
+                return False, "", "Invalid characters detected in input"
+            return True, sanitized, ""
+        
+        # Check if name only uses allowed characters; only scan for dangerous
+        # patterns on rejection, to pick the more specific error message
+        if not cls._ALLOWED.issuperset(sanitized):
+            if cls._DANGEROUS_RE.search(sanitized):
+                return False, "", "Invalid characters detected in input"
+            return False, "", "Pokémon name can only contain letters, numbers, and hyphens"
+        
+        # The allowlist still admits SQL comments and SQL keywords
+        if "--" in sanitized:
+            return False, "", "Invalid characters detected in input"
+        if not cls._SQL_KEYWORDS.isdisjoint(sanitized.replace("-", " ").split()):
+            return False, "", "Invalid characters detected in input"
+        
+        return True, sanitized, ""
+    
+    @classmethod
+    def is_safe_input(cls, user_input: str) -> bool:
+        """
+        Quick check if input is safe (no dangerous patterns).
+        
+        Args:
+            user_input: The raw user input
+            
+        Returns:
+            True if input appears safe, False otherwise
+        """
+        if not user_input:
+            return False
+            
+        return not cls._DANGEROUS_RE.search(user_input.lower())